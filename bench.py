@@ -0,0 +1,222 @@
+"""
+Benchmark the model and view hot paths. Run from the project root:
+
+    python bench.py -o results.json                    # run, save results
+    python bench.py --compare results.json             # fail on regressions
+    python bench.py -k score -k check                  # only matching cases
+
+Each case is timed with timeit (best of `--repeat` runs) and reported as
+microseconds per operation. With `--compare`, exit with status 1 if any case
+is slower than in the given results file by more than `--threshold`.
+"""
+
+from curdle.config import Tier
+from curdle.headless import Curses
+from curdle.model import WordSet, Wordle, score_guess
+from curdle.view import View as CursesView
+from vanilla.view import View as VanillaView
+import argparse
+import contextlib
+import json
+import os
+import platform
+import random
+import shutil
+import sys
+import tempfile
+import timeit
+
+
+class QuietWordle(Wordle):
+    """
+    A Wordle that doesn't write debug.log on every notify(), so cases time
+    just what they're named for. The *_logged cases use a real Wordle.
+    """
+
+    def log(self):
+        pass
+
+
+def game_in_progress():
+    """Return a QuietWordle with a known answer, 3 guesses in: notify() is just the model."""
+    wordle = QuietWordle('crane')
+    wordle.new_game()
+    for guess in ('slate', 'brine', 'crank'):
+        wordle.submit(guess)
+    return wordle
+
+
+def cases():
+    """
+    Yield (name, setup, op) for each benchmark. `setup()` returns the state
+    `op(state)` runs on, so setup costs aren't timed.
+    """
+
+    answers = Wordle().load_wordlist('data/valid_answers.txt')
+
+    def score_all(_):
+        for answer in answers:
+            score_guess('crane', answer)
+
+    yield 'score_guess_all_answers', lambda: None, score_all
+
+    yield 'check_error_hit', QuietWordle, lambda wordle: wordle.check_error('crane')
+    yield 'check_error_miss', QuietWordle, lambda wordle: wordle.check_error('zzzzz')
+
+    def large_history():
+        wordle = QuietWordle()
+        rng = random.Random(0)
+        wordle.scores = [rng.choice((0, 1, 2, 3, 4, 5, 6)) for _ in range(100_000)]
+        return wordle
+
+    yield 'stats_100k_games', large_history, lambda wordle: wordle.stats
+
+    def new_game_cold(_):
+        WordSet.loaded.clear()  # else the dictionary is only read once
+        wordle = QuietWordle()
+        wordle.new_game()
+        wordle.valid_guesses.wait()  # read in the background: time it too
+
+    yield 'new_game_cold', lambda: None, new_game_cold
+    yield 'new_game_warm', QuietWordle, lambda wordle: wordle.new_game()
+    yield 'new_game_tiered_warm', lambda: QuietWordle(tier=Tier.HARD), lambda wordle: wordle.new_game()
+
+    # as in the app, debug.log and all (written to a temp dir, see run())
+    def turn_logged(wordle):
+        wordle.new_game()
+        wordle.submit('slate')
+
+    yield 'new_game_logged', lambda: Wordle('crane'), lambda wordle: wordle.new_game()
+    yield 'turn_logged', lambda: Wordle('crane'), turn_logged
+
+    def curses_view():
+        curses = Curses()
+        view = CursesView(curses, curses.stdscr)
+        return view, game_in_progress()
+
+    def curses_reset(state):
+        view, _ = state
+        view.reset()
+
+    def curses_turn(state):
+        view, wordle = state
+        view.draw_scored_guess(wordle.previous_guesses[-1], 3)
+        wordle.tracker.changed = 0b11111  # as if a guess changed 5 letters
+        view.draw_tracker(wordle.tracker)
+
+    def curses_menu(state):
+        view, _ = state
+        view.show_menu()
+        view.hide_menu()
+
+    yield 'curses_view_reset', curses_view, curses_reset
+    yield 'curses_view_turn', curses_view, curses_turn
+    yield 'curses_view_menu', curses_view, curses_menu
+
+    def vanilla_view():
+        wordle = game_in_progress()
+        return VanillaView(wordle), wordle
+
+    def vanilla_update(state):
+        view, wordle = state
+        view.update(wordle)
+
+    def vanilla_view_played():
+        view, wordle = vanilla_view()
+        wordle.scores = [4, 0, 3, 5, 4, 6, 2]
+        return view, wordle
+
+    def vanilla_stats(state):
+        view, wordle = state
+        view.draw_stats(wordle.stats)
+
+    yield 'vanilla_view_update', vanilla_view, vanilla_update
+    yield 'vanilla_view_stats', vanilla_view_played, vanilla_stats
+
+
+def run(patterns: list, repeat: int):
+    """Time the cases whose names contain any of `patterns` (or all)."""
+
+    # Run in a temp dir with a copy of the data, so real Wordles' debug.log
+    # writes don't land in the project. The views print as they go: send
+    # vanilla output nowhere.
+    cwd = os.getcwd()
+    with tempfile.TemporaryDirectory() as tmp, open(os.devnull, 'w') as devnull, \
+            contextlib.redirect_stdout(devnull):
+        shutil.copytree('data', os.path.join(tmp, 'data'))
+        os.chdir(tmp)
+        try:
+            return time_cases(patterns, repeat)
+        finally:
+            os.chdir(cwd)
+
+
+def time_cases(patterns: list, repeat: int):
+    """Time the cases (see run()), return results by case name."""
+
+    results = {}
+
+    for name, setup, op in cases():
+        if patterns and not any(pattern in name for pattern in patterns):
+            continue
+
+        state = setup()
+        timer = timeit.Timer(lambda: op(state))
+        number, _ = timer.autorange()
+        times = timer.repeat(repeat=repeat, number=number)
+        results[name] = {
+            'us_per_op': round(min(times) / number * 1_000_000, 3),
+            'number': number,
+            'repeat': repeat
+        }
+        print(f'{name:<26} {results[name]["us_per_op"]:>12.3f} µs/op',
+              file=sys.stderr)
+
+    return results
+
+
+def compare(results: dict, baseline: dict, threshold: float):
+    """Return a list of (name, old, new) for cases slower than threshold."""
+    regressions = []
+    for name, result in results.items():
+        if name not in baseline:
+            continue
+        old, new = baseline[name]['us_per_op'], result['us_per_op']
+        if new > old * threshold:
+            regressions.append((name, old, new))
+    return regressions
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Benchmark curdle hot paths.')
+    parser.add_argument('-o', '--output', help='write JSON results to this file')
+    parser.add_argument('-k', dest='patterns', action='append', default=[],
+                        help='only run cases whose name contains this')
+    parser.add_argument('--repeat', type=int, default=5)
+    parser.add_argument('--compare', help='JSON results file to compare against')
+    parser.add_argument('--threshold', type=float, default=1.25,
+                        help='slowdown ratio counted as a regression')
+    args = parser.parse_args()
+
+    output = {
+        'python': platform.python_version(),
+        'platform': platform.platform(),
+        'results': run(args.patterns, args.repeat)
+    }
+
+    if args.output:
+        with open(args.output, 'w') as f:
+            json.dump(output, f, indent=2)
+
+    if args.compare:
+        with open(args.compare) as f:
+            baseline = json.load(f)['results']
+        regressions = compare(output['results'], baseline, args.threshold)
+        for name, old, new in regressions:
+            print(f'REGRESSION {name}: {old:.3f} -> {new:.3f} µs/op', file=sys.stderr)
+        if regressions:
+            sys.exit(1)
+
+
+if __name__ == '__main__':
+    main()
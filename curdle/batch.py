@@ -0,0 +1,110 @@
+"""
+Score (answer, guess) pairs or whole game transcripts in bulk, using the same
+validation and scoring as the app. Input is read as a stream of lines and
+output written as one JSON object per line, so memory use stays constant
+however large the input.
+"""
+
+import json
+import re
+from .config import AppStatus, Error, LetterScore, WORD_LENGTHS
+from .model import Wordle, score_guess
+
+
+def parse(line: str):
+    """
+    Split a line into an answer and its guesses. Words can be separated by
+    spaces, tabs or commas, eg `crane slate crane` or `crane,slate`.
+    """
+    answer, *guesses = re.split(r'[\s,]+', line.strip().lower())
+    return answer, guesses
+
+
+def score_transcript(wordle: Wordle, answer: str, guesses: list):
+    """
+    Play `guesses` against `answer` by the model's rules: an invalid guess
+    gets an error and doesn't use up a turn; the game ends when solved or
+    after MAX_TURNS valid guesses, and any guesses after that are ignored.
+    Return the game as a dict. `result` is as in `Wordle.scores` (turn solved
+    in or 0).
+    """
+
+    turns = []
+    status = AppStatus.PLAYING
+    result = 0
+    turn = 0
+    played = 0
+
+    for guess in guesses:
+        if status is not AppStatus.PLAYING:
+            break
+        played += 1
+
+        if error := wordle.check_error(guess):
+            turns.append({'guess': guess, 'error': str(error)})
+            continue
+
+        turn += 1
+        scored_guess = score_guess(guess, answer)
+        turns.append({'guess': guess, 'score': [int(score) for _, score in scored_guess]})
+
+        if all(score is LetterScore.CORRECT for _, score in scored_guess):
+            status = AppStatus.SOLVED
+            result = turn
+        elif turn == wordle.MAX_TURNS:
+            status = AppStatus.GAMEOVER
+
+    return {
+        'answer': answer,
+        'status': status.value,
+        'result': result,
+        'turns': turns,
+        'ignored': len(guesses) - played
+    }
+
+
+def score_lines(lines):
+    """
+    Take an iterable of lines (eg a file or stdin) and lazily yield a result
+    dict per non-blank line. Lines with an invalid answer yield an error
+    instead. Answers can be any supported length: one Wordle instance per
+    length is shared for validation, so each word list is only loaded once
+    (and only if needed).
+    """
+
+    wordles = {}  # word length: Wordle
+
+    for line_number, line in enumerate(lines, 1):
+        if not line.strip():
+            continue
+
+        answer, guesses = parse(line)
+        length = len(answer)
+        if length in WORD_LENGTHS and length not in wordles:
+            try:
+                wordles[length] = Wordle(answer)  # given one, no answers list needed
+            except FileNotFoundError:  # ie no word list for this length
+                wordles[length] = None
+        wordle = wordles.get(length)
+
+        if wordle:
+            error = wordle.check_error(answer)
+        elif length < WORD_LENGTHS[0]:
+            error = Error.TOOSHORT
+        elif length > WORD_LENGTHS[-1]:
+            error = Error.INVALID
+        else:
+            error = f'No word list for {length}-letter words'
+
+        if error:
+            yield {'line': line_number, 'answer': answer, 'error': str(error)}
+        else:
+            yield {'line': line_number, **score_transcript(wordle, answer, guesses)}
+
+
+def run(infile, outfile):
+    """Score every line of `infile`, write results to `outfile` as JSONL."""
+    write = outfile.write
+    for result in score_lines(infile):
+        write(json.dumps(result, separators=(',', ':')) + '\n')
+    outfile.flush()
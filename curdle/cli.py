@@ -0,0 +1,34 @@
+"""
+Command line options shared by project.py and project-v.py:
+
+    python project-v.py [answer] [--length N] [--startup-time]
+
+Parsed by hand rather than with argparse, which would add noticeably to
+time to first frame for three options.
+"""
+
+import sys
+
+USAGE = 'usage: [answer] [--length N (4-8)] [--startup-time]'
+
+
+def parse_args(argv: list):
+    """Return a dict of options from command line args (eg sys.argv[1:])."""
+
+    options = {'answer': '', 'length': 5, 'startup_time': False}
+    args = iter(argv)
+
+    for arg in args:
+        if arg == '--startup-time':
+            options['startup_time'] = True
+        elif arg == '--length' or arg.startswith('--length='):
+            value = arg.partition('=')[2] or next(args, '')
+            if not value.isdigit():
+                sys.exit(USAGE)
+            options['length'] = int(value)
+        elif arg.startswith('-') or options['answer']:
+            sys.exit(USAGE)
+        else:
+            options['answer'] = arg.lower()
+
+    return options
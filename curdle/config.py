@@ -86,6 +86,21 @@ class Rating(Enum):
         return self.name.capitalize()
 
 
+class Tier(IntEnum):
+    """Encode answer difficulty tiers (see difficulty.py)."""
+    EASY = 1
+    MEDIUM = 2
+    HARD = 3
+
+    def __str__(self):
+        return self.name.capitalize()
+
+
+# Supported word lengths. 5 is standard; others need their own word lists
+# (see model.data_file()).
+WORD_LENGTHS = range(4, 9)
+
+
 # For vanilla app: a mapping of eg GREEN to 3 etc for letter scores. L GREY
 # (-1) for blanks.
 SCORE_COLORS = (
@@ -1,4 +1,4 @@
-from .config import AppStatus, MenuOption
+from .config import AppStatus, Error, MenuOption
 
 
 class Controller:
@@ -23,7 +23,7 @@ class Controller:
         Reset game (model/view) for initial setup + to enable multiple games.
         """
         self.wordle.new_game()
-        self.view.reset()
+        self.view.reset(self.wordle.length, self.wordle.tracker)
 
     def run(self):
         """Run the application main loop."""
@@ -47,16 +47,18 @@ class Controller:
                     raise SystemExit()
                 continue
 
-            scored_guess, response = self.wordle.submit(user_input)
+            # results are read back from the model rather than returned
+            self.wordle.submit(user_input)
+            response = self.wordle.alert
 
-            if scored_guess:  # if guess found in list
-                self.view.draw_scored_guess(scored_guess, turn)
-            else:
-                self.view.alert(response)  # ie 'not in word list' error
+            if isinstance(response, Error):  # ie 'not in word list' error
+                self.view.alert(str(response))
+            else:  # guess found in list
+                self.view.draw_scored_guess(self.wordle.previous_guesses[-1], turn)
 
             self.view.draw_tracker(self.wordle.tracker)
 
             # output message if solved or game over, enable menu
             if self.wordle.app_status != AppStatus.PLAYING:
-                self.view.alert(response, end_game=True)  # flag joins threads
+                self.view.alert(str(response), end_game=True)  # flag joins threads
                 self.menu(end_game=True)  # flag disables 0 to close menu
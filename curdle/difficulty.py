@@ -0,0 +1,153 @@
+"""
+Rate how hard each answer is, so games can be drawn from easy, medium or hard
+tiers. Ratings are worked out offline, by playing every answer with a simple
+reference solver, and stored compactly in data/difficulty.bin (or eg
+data/difficulty_6.bin for 6-letter words). Rebuild it (eg if the answers
+list changes) with:
+
+    python -m curdle.difficulty [word length]
+
+Each answer gets two numbers: the guesses the solver needs to find it, and
+the size of its feedback class after the solver's opening guess (ie how many
+answers score the same against the opener; the more, the harder). Answers
+are ranked by both and split into three equal tiers when the index is loaded.
+"""
+
+from array import array
+from collections import defaultdict
+from functools import lru_cache
+from zlib import crc32
+import sys
+from .config import Tier
+from .model import data_file, score_guess
+
+# solver's fixed first guess for 5-letter words (a strong opener); for other
+# lengths the solver picks its own
+OPENER = 'salet'
+
+
+def feedback(guess: str, answer: str):
+    """Return just the scores of a scored guess, as a hashable tuple."""
+    return tuple(score for _, score in score_guess(guess, answer))
+
+
+def partition(guess: str, candidates: list):
+    """Group candidates by the feedback they'd give for `guess`."""
+    groups = defaultdict(list)
+    for answer in candidates:
+        groups[feedback(guess, answer)].append(answer)
+    return groups
+
+
+def best_guess(candidates: list):
+    """
+    Pick the candidate that leaves the fewest answers on average (sum of
+    squared group sizes), breaking ties alphabetically. Only candidates are
+    tried, so the solver could win on any guess.
+    """
+    def remaining(guess):
+        return sum(len(group) ** 2 for group in partition(guess, candidates).values())
+
+    return min(sorted(candidates), key=remaining)
+
+
+def solve(candidates: list, guess: str, turn: int, guesses: dict):
+    """
+    Play `guess` against every candidate, record in `guesses` the turn each
+    answer is found on, recurse into each feedback group.
+    """
+    for answer_feedback, group in partition(guess, candidates).items():
+        if all(score == 3 for score in answer_feedback):  # ie CORRECT
+            guesses[guess] = turn
+        elif len(group) == 1:
+            guesses[group[0]] = turn + 1
+        else:
+            solve(group, best_guess(group), turn + 1, guesses)
+
+
+def build(answers: list):
+    """Return (guesses needed, opener class size) arrays in answers order."""
+
+    opener = OPENER if len(answers[0]) == len(OPENER) else best_guess(answers)
+
+    guesses = {}
+    solve(answers, opener, 1, guesses)
+
+    class_sizes = {}
+    for group in partition(opener, answers).values():
+        for answer in group:
+            class_sizes[answer] = len(group)
+
+    return (array('B', (guesses[answer] for answer in answers)),
+            array('H', (class_sizes[answer] for answer in answers)))
+
+
+def checksum(answers: list):
+    """Return a CRC-32 of the answers in order, to tie an index to its list."""
+    return crc32('\n'.join(answers).encode())
+
+
+def save(filename: str, answers: list, guesses: array, class_sizes: array):
+    """
+    Write the index, little-endian: answer count (uint16), checksum of the
+    answers (uint32), then guesses (uint8 each), then class sizes (uint16
+    each).
+    """
+    header = (array('H', [len(guesses)]), array('I', [checksum(answers)]))
+    with open(filename, 'wb') as f:
+        for values in (*header, guesses, class_sizes):
+            if sys.byteorder == 'big':
+                values = array(values.typecode, values)
+                values.byteswap()
+            values.tofile(f)
+
+
+@lru_cache(maxsize=None)
+def load(length: int = 5):
+    """
+    Read the index for a word length once and split the answers into tiers:
+    return a dict of Tier: tuple of answers. Answers are ranked by guesses
+    needed, then class size, then alphabetically (so tiers are stable across
+    rebuilds).
+    """
+
+    index_file = data_file('difficulty', length, 'bin')
+    answers_file = data_file('valid_answers', length)
+
+    with open(answers_file) as f:
+        answers = f.read().splitlines()
+
+    count, crc, guesses, class_sizes = array('H'), array('I'), array('B'), array('H')
+    with open(index_file, 'rb') as f:
+        count.fromfile(f, 1)
+        crc.fromfile(f, 1)
+        if sys.byteorder == 'big':
+            count.byteswap()
+            crc.byteswap()
+        # ratings are matched to answers by position: any edit (even one
+        # that keeps the count) puts them on the wrong words
+        if count[0] != len(answers) or crc[0] != checksum(answers):
+            raise ValueError(f'{index_file} is out of date with {answers_file}: '
+                             'rebuild it with `python -m curdle.difficulty`')
+        guesses.fromfile(f, count[0])
+        class_sizes.fromfile(f, count[0])
+    if sys.byteorder == 'big':
+        class_sizes.byteswap()
+
+    ranked = sorted(zip(guesses, class_sizes, answers))
+    size = -(-len(ranked) // len(Tier))  # ceiling division
+    return {
+        tier: tuple(answer for *_, answer in ranked[i * size:(i + 1) * size])
+        for i, tier in enumerate(Tier)
+    }
+
+
+if __name__ == '__main__':
+    length = int(sys.argv[1]) if len(sys.argv) > 1 else 5
+    index_file = data_file('difficulty', length, 'bin')
+    with open(data_file('valid_answers', length)) as f:
+        answers = f.read().splitlines()
+    guesses, class_sizes = build(answers)
+    save(index_file, answers, guesses, class_sizes)
+    print(f'Wrote {index_file}: {len(answers)} answers, '
+          f'mean {sum(guesses) / len(guesses):.3f} guesses, max {max(guesses)}')
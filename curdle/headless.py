@@ -0,0 +1,135 @@
+"""
+An in-memory stand-in for curses (and curses.panel), enough to run the curses
+View without a terminal, eg for benchmarks, tests or replays:
+
+    curses = Curses()
+    view = View(curses, curses.stdscr)
+
+Windows keep their contents as rows of characters (see `FakeWindow.text()`)
+and read keypresses from `curses.keys`. When the keys run out, `getkey()`
+raises EOFError, as `input()` does at the end of stdin. A None key makes it
+raise curses.error, as a real getkey() can (eg on terminal resize).
+"""
+
+from collections import deque
+from types import SimpleNamespace
+
+
+class FakeWindow:
+    """Record what's drawn to a window instead of drawing it."""
+
+    def __init__(self, curses, height: int, width: int, y: int = 0, x: int = 0):
+        self.curses = curses
+        self.height, self.width = height, width
+        self.y, self.x = y, x
+        self.rows = [[' '] * width for _ in range(height)]
+        self.cursor = (0, 0)
+
+    def addstr(self, *args):
+        """As curses: addstr([y, x,] text[, attr]). Attributes are ignored."""
+        if len(args) > 2:
+            y, x, text = args[:3]
+        else:
+            (y, x), text = self.cursor, args[0]
+
+        if not (0 <= y < self.height and 0 <= x and x + len(text) <= self.width):
+            raise self.curses.error('addstr() returned ERR')
+
+        self.rows[y][x:x + len(text)] = text
+        self.cursor = (y, x + len(text))
+
+    def border(self):
+        pass
+
+    def clear(self):
+        self.rows = [[' '] * self.width for _ in range(self.height)]
+        self.cursor = (0, 0)
+
+    def getkey(self):
+        try:
+            key = self.curses.keys.popleft()
+        except IndexError:
+            raise EOFError from None
+        if key is None:  # as recorded when a real getkey() failed
+            raise self.curses.error('no input')
+        return key
+
+    def getmaxyx(self):
+        return self.height, self.width
+
+    def keypad(self, flag: bool):
+        pass
+
+    def refresh(self):
+        self.curses.refreshes += 1
+
+    def text(self):
+        """Return window contents as a string, one line per row."""
+        return '\n'.join(''.join(row) for row in self.rows)
+
+
+class FakePanel:
+
+    def __init__(self, window: FakeWindow):
+        self.window = window
+        self.is_hidden = False
+
+    def hidden(self):
+        return self.is_hidden
+
+    def hide(self):
+        self.is_hidden = True
+
+    def show(self):
+        self.is_hidden = False
+
+    def top(self):
+        pass
+
+
+class Curses:
+    """
+    Provide the parts of the curses API the View uses. Attribute values are
+    arbitrary but distinct, as in curses.
+    """
+
+    A_NORMAL = 0
+    A_BOLD = 1 << 21
+    A_REVERSE = 1 << 18
+
+    class error(Exception):
+        pass
+
+    def __init__(self, lines: int = 24, cols: int = 80, keys=()):
+        self.keys = deque(keys)  # pending keypresses, see FakeWindow.getkey()
+        self.refreshes = 0  # count of window refreshes (≈ repaints)
+        self.stdscr = FakeWindow(self, lines, cols)
+        self.panels = []  # all panels made, see visible_panels()
+        self.panel = SimpleNamespace(new_panel=self.new_panel, update_panels=lambda: None)
+
+    def color_pair(self, pair_id: int):
+        return pair_id << 8
+
+    def curs_set(self, visibility: bool):
+        pass
+
+    def flushinp(self):
+        pass
+
+    def init_pair(self, pair_id: int, fg: int, bg: int):
+        pass
+
+    def new_panel(self, window: FakeWindow):
+        new_panel = FakePanel(window)
+        self.panels.append(new_panel)
+        return new_panel
+
+    def visible_panels(self):
+        """Return the windows of panels not hidden (≈ the panel stack)."""
+        return [panel.window for panel in self.panels if not panel.hidden()]
+
+    def newwin(self, height: int, width: int, y: int = 0, x: int = 0):
+        return FakeWindow(self, height, width, y, x)
+
+    def use_default_colors(self):
+        pass
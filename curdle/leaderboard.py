@@ -0,0 +1,211 @@
+"""
+Aggregate finished games across all sessions (and worker processes) into
+global stats: win rate, guess distribution, streak leaders and percentile
+rank of a player's mean guesses, in memory that stays flat however many
+players there are.
+
+Set a Wordle's `leaderboard` and `player` (a Player, which keeps the
+player's own running totals) to feed it: each finished game is put on a
+bounded queue by `finish_turn()` (or dropped and counted if the queue is
+full, so a slow consumer never holds up a game), then folded into running
+totals by `drain()` or a background thread (`start()`).
+
+The aggregates are all additive and keep nothing per player: games by
+result (mean guesses are ranked against these) and a min-heap of the top
+`top` streaks. So totals from several processes combine by addition: each
+worker ships what it's gathered since last time with `take()` (as
+`to_dict()`), and one aggregating Leaderboard (or Totals) `merge()`s them
+and answers for global stats. A worker's own stats only cover its games
+since its last `take()`.
+"""
+
+from heapq import heappush, heapreplace, heapify, nlargest
+from queue import Empty, Full, Queue
+from threading import Lock, Thread
+
+MAX_TURNS = 6  # as Wordle.MAX_TURNS
+
+
+class Player:
+    """
+    A player's running totals over all their games (not one session's), so
+    each finished game is summarised in O(1). Persist it with their account
+    to carry streaks across sessions.
+    """
+
+    __slots__ = ('name', 'wins', 'guesses', 'streak')
+
+    def __init__(self, name: str, wins: int = 0, guesses: int = 0, streak: int = 0):
+        self.name = name
+        self.wins = wins  # games won
+        self.guesses = guesses  # total guesses in games won
+        self.streak = streak  # current run of wins
+
+    @property
+    def mean(self):
+        """Return mean guesses in games won (None if none won), cf Totals.rank()."""
+        return self.guesses / self.wins if self.wins else None
+
+    def add_game(self, result: int):
+        """Update totals with a game result (as in Wordle.scores)."""
+        if result:
+            self.wins += 1
+            self.guesses += result
+            self.streak += 1
+        else:
+            self.streak = 0
+
+
+class Totals:
+    """Running, mergeable aggregates of finished games."""
+
+    def __init__(self, top: int = 10):
+        self.top = top
+        self.distribution = [0] * (MAX_TURNS + 1)  # games by result, 0 = lost
+        self.leaders = []  # min-heap of (best streak, player), ≤ `top` long
+
+    def add(self, event: tuple):
+        """Fold in a game event: (player name, result, current streak)."""
+
+        player, result, streak = event
+        self.distribution[result] += 1
+
+        if streak:
+            self.add_leader(player, streak)
+
+    def add_leader(self, player: str, streak: int):
+        """Keep `player` in the top streaks if `streak` earns it."""
+
+        # already a leader? update if better (heap is small, so scan is fine)
+        for i, (best, leader) in enumerate(self.leaders):
+            if leader == player:
+                if streak > best:
+                    self.leaders[i] = (streak, player)
+                    heapify(self.leaders)
+                return
+
+        if len(self.leaders) < self.top:
+            heappush(self.leaders, (streak, player))
+        elif streak > self.leaders[0][0]:
+            heapreplace(self.leaders, (streak, player))
+
+    def merge(self, other: 'Totals'):
+        """Add another Totals (eg from another process) into this one."""
+
+        self.distribution = [a + b for a, b in zip(self.distribution, other.distribution)]
+
+        best = {}
+        for streak, player in self.leaders + other.leaders:
+            best[player] = max(streak, best.get(player, 0))
+        self.leaders = nlargest(self.top, ((streak, player) for player, streak in best.items()))
+        heapify(self.leaders)
+
+    def rank(self, mean: float):
+        """
+        Return the percentile rank of a mean guesses figure (eg Player.mean)
+        among all games: the % of games that took more guesses (lost games
+        counting as worst), with games that took exactly `mean` counted half.
+        """
+        played = sum(self.distribution)
+        if not played:
+            return 0
+        worse = self.distribution[0] + sum(
+            games if result > mean else games / 2 if result == mean else 0
+            for result, games in enumerate(self.distribution[1:], 1))
+        return round(worse / played * 100)
+
+    @property
+    def stats(self):
+        """Return global stats, cf Wordle.stats."""
+        played = sum(self.distribution)
+        return {
+            'played': played,
+            'wins': round((played - self.distribution[0]) / played * 100) if played else 0,
+            'distribution': {i: self.distribution[i] for i in range(1, MAX_TURNS + 1)},
+            'leaders': [(player, streak) for streak, player in sorted(self.leaders, reverse=True)]
+        }
+
+    def to_dict(self):
+        """Return totals as a JSON-serialisable dict, eg to send to another process."""
+        return {
+            'top': self.top,
+            'distribution': self.distribution,
+            'leaders': self.leaders
+        }
+
+    @classmethod
+    def from_dict(cls, data: dict):
+        totals = cls(data['top'])
+        totals.distribution = list(data['distribution'])
+        totals.leaders = [tuple(leader) for leader in data['leaders']]
+        heapify(totals.leaders)
+        return totals
+
+
+class Leaderboard:
+    """Collect finished games from sessions into Totals via a bounded queue."""
+
+    def __init__(self, top: int = 10, maxsize: int = 10_000):
+        self.queue = Queue(maxsize)
+        self.dropped = 0  # games lost to a full queue
+        self.totals = Totals(top)
+        self.lock = Lock()  # guards totals if a consumer thread is running
+        self.thread = None
+
+    def record(self, player: Player, result: int):
+        """
+        Update the player's totals with a finished game and queue it (called
+        from Wordle.finish_turn()).
+        """
+        player.add_game(result)
+        try:
+            self.queue.put_nowait((player.name, result, player.streak))
+        except Full:
+            self.dropped += 1
+
+    def drain(self):
+        """Fold all queued games into the totals, return how many."""
+        count = 0
+        with self.lock:
+            while True:
+                try:
+                    self.totals.add(self.queue.get_nowait())
+                except Empty:
+                    return count
+                count += 1
+
+    def start(self):
+        """Fold games in as they arrive, in a background thread."""
+
+        def consume():
+            while True:
+                event = self.queue.get()
+                with self.lock:
+                    self.totals.add(event)
+
+        self.thread = Thread(target=consume, daemon=True)
+        self.thread.start()
+
+    def take(self):
+        """
+        Fold in queued games, then return the totals gathered since the last
+        take() and start afresh: ship these to the aggregating process, so
+        no game is merged twice.
+        """
+        self.drain()
+        with self.lock:
+            totals, self.totals = self.totals, Totals(self.totals.top)
+        return totals
+
+    def merge(self, other: Totals):
+        with self.lock:
+            self.totals.merge(other)
+
+    @property
+    def stats(self):
+        with self.lock:
+            return self.totals.stats
+
+    def rank(self, mean: float):
+        with self.lock:
+            return self.totals.rank(mean)
@@ -5,10 +5,147 @@ using this class). See README.md for details.
 """
 
 from collections import Counter
-from .config import AppStatus, Error, LetterScore, MenuOption, Rating
+from .config import AppStatus, Error, LetterScore, MenuOption, Rating, Tier, WORD_LENGTHS
 from itertools import groupby
-from random import shuffle
+from os import urandom
+from os.path import exists
+from .probe import probe
 from string import ascii_lowercase as a_to_z
+from threading import Thread
+
+
+@probe
+def score_guess(guess: str, answer: str):
+    """
+    Take a guess and compare it with an answer to score it. Return a scored
+    guess, a list of tuple pairs [(letter, score)…] where score is either
+    ABSENT (dark grey), PRESENT (yellow) or CORRECT (green). Module level so
+    it can be used without a Wordle instance (eg batch scoring).
+    """
+
+    # Default all letters in guess to ABSENT (1/dark grey); copy answer to
+    # a list (so we can remove letters).
+    scored_guess = [(letter, LetterScore.ABSENT) for letter in guess]
+    answer_letters = list(answer)
+
+    # first find CORRECT (3, green) letters
+    for i, (guess_letter, answer_letter) in enumerate(zip(guess, answer)):
+        if guess_letter == answer_letter:
+            scored_guess[i] = (guess_letter, LetterScore.CORRECT)
+            answer_letters.remove(guess_letter)
+
+    # then find PRESENT (2, yellow) letters
+    for i, (guess_letter, score) in enumerate(scored_guess):
+        if guess_letter in answer_letters and score is not LetterScore.CORRECT:
+            scored_guess[i] = (guess_letter, LetterScore.PRESENT)
+            answer_letters.remove(guess_letter)
+
+    return scored_guess
+
+
+# qwerty layout as rows of (letter, tracker index), worked out once. Tracker
+# indexes are letter positions in a-z, ie ord(letter) - 97 (ord('a')).
+QWERTY = tuple(
+    tuple((letter, ord(letter) - 97) for letter in row)
+    for row in ('qwertyuiop', 'asdfghjkl', 'zxcvbnm')
+)
+
+
+class Tracker:
+    """
+    Record the best score (LetterScore value) so far for each letter, in a
+    26-byte array indexed by letter (a = 0). A bitmask (bit n = letter n)
+    records which letters have changed since it was last read, so views can
+    redraw just those. Compact since there's one per game session.
+    """
+
+    __slots__ = ('scores', 'changed')
+
+    def __init__(self):
+        self.scores = bytearray(len(a_to_z))  # all 0, ie UNGUESSED
+        self.changed = 0
+
+    def __getitem__(self, letter: str):
+        return self.scores[ord(letter) - 97]
+
+    def items(self):
+        """Return (letter, score) pairs in a-z order, as dict.items()."""
+        return zip(a_to_z, self.scores)
+
+    def pop_changed(self):
+        """Return the changed letters bitmask and clear it."""
+        changed, self.changed = self.changed, 0
+        return changed
+
+    def reset(self):
+        """Set all letters back to UNGUESSED (and so changed)."""
+        self.scores[:] = bytes(len(a_to_z))
+        self.changed = (1 << len(a_to_z)) - 1
+
+    def update(self, scored_guess: list):
+        """Only change a letter's score if it's to a higher one."""
+        scores = self.scores
+        for letter, score in scored_guess:
+            i = ord(letter) - 97
+            if score > scores[i]:
+                scores[i] = score
+                self.changed |= 1 << i
+
+
+def data_file(name: str, length: int, extension: str = 'txt'):
+    """
+    Return the path of the data file `name` for a word length. Each length has
+    its own files: eg valid_guesses.txt is for standard 5-letter games,
+    valid_guesses_6.txt for 6-letter ones.
+    """
+    suffix = '' if length == 5 else f'_{length}'
+    return f'data/{name}{suffix}.{extension}'
+
+
+class WordSet:
+    """
+    A set of words read from a file in a background thread, so startup isn't
+    held up by it. Membership tests wait for the read to finish if need be.
+    One WordSet per file is shared by all Wordle instances (see `load()`), and
+    files are only read when first asked for, so word lists for lengths not
+    being played cost nothing.
+    """
+
+    loaded = {}  # filename: WordSet
+
+    @classmethod
+    def load(cls, filename: str):
+        """Return the WordSet for `filename`, starting to read it if new."""
+        if filename not in cls.loaded:
+            cls.loaded[filename] = cls(filename)
+        return cls.loaded[filename]
+
+    def __init__(self, filename: str):
+        self.words = None  # set once read
+        self.error = None  # eg FileNotFoundError, re-raised when used
+        self.thread = Thread(target=self.read, args=(filename,), daemon=True)
+        self.thread.start()
+
+    def read(self, filename: str):
+        try:
+            with open(filename) as f:
+                self.words = set(f.read().splitlines())
+        except OSError as e:
+            self.error = e
+
+    def wait(self):
+        """Block until the words are loaded, return them."""
+        if self.words is None:
+            self.thread.join()
+            if self.error:
+                raise self.error
+        return self.words
+
+    def __contains__(self, word: str):
+        return word in (self.words or self.wait())
+
+    def __len__(self):
+        return len(self.wait())
 
 
 class Menu:
@@ -29,31 +166,57 @@ class Menu:
 
 class Wordle:
 
-    def __init__(self, answer: str = ''):
-        """Set up a Wordle instance."""
+    def __init__(self, answer: str = '', tier: Tier = None, seed: int = None,
+                 length: int = 5):
+        """
+        Set up a Wordle instance. Pass in `tier` (or set it any time) to draw
+        answers only from that difficulty tier, `seed` to make the order of
+        answers repeatable (eg for replays), `length` for words of other than
+        5 letters (if an answer is passed in, its length is used).
+        """
+
+        self.length = len(answer) or length
+        if self.length not in WORD_LENGTHS:
+            raise ValueError(f'word length must be {WORD_LENGTHS[0]}-{WORD_LENGTHS[-1]}')
+        if answer and not (answer.isascii() and answer.isalpha()):
+            raise ValueError('answer must be letters a-z only')
 
-        self.answers_file = 'data/valid_answers.txt'
+        self.answers_file = data_file('valid_answers', self.length)
         self.valid_answers = []  # answers handled in new_game()
+        self.tier = tier
+        self.tiered_answers = {}  # Tier: answers, as valid_answers
         self.given_answer = answer  # save answer here if passed in
+        self.seed = seed
+        self.random = None  # random.Random(seed), made for the second answer (see pick())
         self.answer = ''  # see new_game() and comment there
 
-        self.guesses_file = 'data/valid_guesses.txt'
-        self.valid_guesses = set(self.load_wordlist(self.guesses_file))
+        # Check up front that the files needed for this length exist: they're
+        # read in the background or at new game, so would otherwise only fail
+        # mid-game (or inside curses).
+        self.guesses_file = data_file('valid_guesses', self.length)
+        needed = {self.guesses_file: ('word list', 'curdle.wordlists')}
+        if not answer:
+            needed[self.answers_file] = ('word list', 'curdle.wordlists')
+        if tier:
+            needed[data_file('difficulty', self.length, 'bin')] = \
+                ('difficulty index', f'curdle.difficulty {self.length}')
+        for filename, (kind, module) in needed.items():
+            if not exists(filename):
+                raise FileNotFoundError(
+                    f'No {kind} for {self.length}-letter words ({filename}): '
+                    f'make one with `python -m {module}`')
+        self.valid_guesses = WordSet.load(self.guesses_file)  # loads in background
         self.previous_guesses = []  # record of submitted, scored guesses
 
         self.app_status = AppStatus.START
         self.MAX_TURNS = 6
-        self.tracker = {}  # record guessed letters
+        self.tracker = Tracker()  # record guessed letters
         self.scores = []  # record game results per session
+        self.player = None  # leaderboard.Player, ie who's playing
+        self.leaderboard = None  # set to feed global stats (see leaderboard.py)
         self.alert = ''  # ≈ popup message to user
         self.observers = []  # for MVC with Observer pattern
 
-    @property
-    def qwerty(self):
-        """Return the tracker formatted in qwerty order/layout."""
-        rows = ['qwertyuiop', 'asdfghjkl', 'zxcvbnm']
-        return [[(letter, self.tracker[letter]) for letter in row] for row in rows]
-
     @property
     def stats(self):
         """Turn self.scores into a stats dictionary."""
@@ -94,13 +257,15 @@ class Wordle:
         """Enable observer to add itself to the list."""
         self.observers.append(observer)
 
+    @probe
     def check_error(self, guess: str):
         """Check for errors: return Error if invalid or None if valid."""
-        if len(guess) < 5:
+        if len(guess) < self.length:
             return Error.TOOSHORT
         elif guess not in self.valid_guesses:
             return Error.INVALID
 
+    @probe
     def finish_turn(self, scored_guess: list):
         """
         Update game elements at end of turn. If game solved or over, change
@@ -126,6 +291,11 @@ class Wordle:
         self.previous_guesses.append(scored_guess)
         self.update_tracker()
 
+        # if game finished, feed result to global stats (unless no one to
+        # credit it to, eg a guest)
+        if self.leaderboard and self.player and self.app_status is not AppStatus.PLAYING:
+            self.leaderboard.record(self.player, self.scores[-1])
+
         return response
 
     def load_wordlist(self, filename: str):
@@ -136,25 +306,62 @@ class Wordle:
     def new_game(self):
         """Set/reset here anything needed to support multiple games."""
 
-        # initialise tracker letters as UNGUESSED (ie 0/light grey)
-        self.tracker = {letter: LetterScore.UNGUESSED for letter in a_to_z}
+        # reset tracker letters to UNGUESSED (ie 0/light grey)
+        self.tracker.reset()
         self.previous_guesses = []
         self.alert = ''
 
-        # answers loaded here not in init, with shuffle/pop not random.choice,
-        # to support arbitrarily many games with minimal answer repetition
-        if not self.valid_answers:
-            self.valid_answers = self.load_wordlist(self.answers_file)
-            shuffle(self.valid_answers)
-
         # If an answer has been passed in, use that. Get one if not. Can't
         # just set `self.answer` directly in init without `given_answer`
         # buffer, or renewing answer in subsequent games prevented here.
-        self.answer = self.given_answer or self.valid_answers.pop()
+        self.answer = self.given_answer or self.next_answer()
         self.app_status = AppStatus.PLAYING
 
         self.notify()  # signal game start to obervers
 
+    def next_answer(self):
+        """
+        Return a new answer, from `self.tier` if set. Answers loaded here not
+        in init, and drawn without replacement not with random.choice, to
+        support arbitrarily many games with minimal answer repetition. Tiers
+        come ready-made from the difficulty index, so nothing is worked out
+        per game.
+        """
+
+        if self.tier:
+            from .difficulty import load  # only for tiers (and imports this module)
+
+            answers = self.tiered_answers.setdefault(self.tier, [])
+            if not answers:
+                answers.extend(load(self.length)[self.tier])
+        else:
+            answers = self.valid_answers
+            if not answers:
+                answers.extend(self.load_wordlist(self.answers_file))
+
+        # swap a random answer to the end and pop it
+        i = self.pick(len(answers))
+        answers[i], answers[-1] = answers[-1], answers[i]
+        return answers.pop()
+
+    def pick(self, count: int):
+        """
+        Return a random index below `count`. The first comes straight from
+        the seed (or os.urandom): `random` takes ~6ms to import, most of
+        what's left on the way to the first frame, so it waits for the next.
+        """
+        if self.random:
+            return self.random.randrange(count)
+        if self.random is None:
+            self.random = False  # ie make it next time
+            seed = self.seed if self.seed is not None else int.from_bytes(urandom(8), 'little')
+            return seed % count
+
+        from random import Random
+        self.random = Random(self.seed)
+        return self.random.randrange(count)
+
+    @probe
     def notify(self):
         """Part of MVC/Observer pattern: tell observers model has changed."""
         for observer in self.observers:
@@ -164,31 +371,10 @@ class Wordle:
         self.log()
 
     def score_guess(self, guess: str):
-        """
-        Take a guess and compare it with the answer to score it. Return a
-        scored guess, a list of tuple pairs [(letter, score)…] where score
-        is either ABSENT (dark grey), PRESENT (yellow) or CORRECT (green).
-        """
-
-        # Default all letters in guess to ABSENT (1/dark grey); copy answer to
-        # a list (so we can remove letters).
-        scored_guess = [(letter, LetterScore.ABSENT) for letter in guess]
-        answer_letters = list(self.answer)
-
-        # first find CORRECT (3, green) letters
-        for i, (guess_letter, answer_letter) in enumerate(zip(guess, self.answer)):
-            if guess_letter == answer_letter:
-                scored_guess[i] = (guess_letter, LetterScore.CORRECT)
-                answer_letters.remove(guess_letter)
-
-        # then find PRESENT (2, yellow) letters
-        for i, (guess_letter, score) in enumerate(scored_guess):
-            if guess_letter in answer_letters and score is not LetterScore.CORRECT:
-                scored_guess[i] = (guess_letter, LetterScore.PRESENT)
-                answer_letters.remove(guess_letter)
-
-        return scored_guess
+        """Score a guess against the current answer (see `score_guess()`)."""
+        return score_guess(guess, self.answer)
 
+    @probe
     def submit(self, guess: str):
         """
         Take in guess then delegate: validate it, score it, save it, update
@@ -212,9 +398,9 @@ class Wordle:
         Update tracker with each letter from `scored_guess`.
         Only change a letter's score if it's to a higher one.
         """
-        for letter, score in self.previous_guesses[-1]:
-            self.tracker[letter] = max(self.tracker[letter], score)
+        self.tracker.update(self.previous_guesses[-1])
 
+    @probe
     def log(self):
         """To aid debugging"""
         with open('debug.log', 'w') as f:
@@ -0,0 +1,92 @@
+"""
+Opt-in timing instrumentation for hot paths. Decorate a function with
+`@probe` to record its call count, total time and a latency histogram.
+
+Probes are only installed if the CURDLE_PROBE environment variable is set when
+this module is first imported: to a file path to dump the results there as
+JSON on exit, or to `1` to collect them without dumping (read them with
+`snapshot()`). Otherwise `probe` returns the function unchanged, so there's
+no overhead at all when disabled.
+"""
+
+import atexit
+import os
+from functools import wraps
+from time import perf_counter
+
+ENABLED = bool(os.environ.get('CURDLE_PROBE'))
+
+# Histogram bucket i counts calls taking [2**(i-1), 2**i) µs (bucket 0 is
+# < 1µs). The last bucket also catches anything slower (> ~4s).
+BUCKETS = 24
+
+timings = {}  # probe name: Timing
+
+
+class Timing:
+    """Call count, total time and latency histogram for one probe."""
+
+    __slots__ = ('calls', 'total', 'histogram')
+
+    def __init__(self):
+        self.calls = 0
+        self.total = 0.0  # seconds
+        self.histogram = [0] * BUCKETS
+
+    def add(self, seconds: float):
+        self.calls += 1
+        self.total += seconds
+        micros = int(seconds * 1_000_000)
+        self.histogram[min(micros.bit_length(), BUCKETS - 1)] += 1
+
+    def to_dict(self):
+        # only keep non-empty buckets, labelled by upper bound in µs
+        return {
+            'calls': self.calls,
+            'total_ms': round(self.total * 1000, 3),
+            'mean_us': round(self.total / self.calls * 1_000_000, 3) if self.calls else 0,
+            'histogram_us': {f'<{2 ** i}': n for i, n in enumerate(self.histogram) if n}
+        }
+
+
+def wrap(func, name: str = ''):
+    """Return `func` wrapped to record its timings under `name`."""
+
+    timing = timings.setdefault(name or f'{func.__module__}.{func.__qualname__}', Timing())
+
+    @wraps(func)
+    def wrapper(*args, **kwargs):
+        start = perf_counter()
+        try:
+            return func(*args, **kwargs)
+        finally:
+            timing.add(perf_counter() - start)
+
+    return wrapper
+
+
+def probe(func):
+    """Decorator: time `func` if probes are enabled, else leave it alone."""
+    return wrap(func) if ENABLED else func
+
+
+def snapshot():
+    """Return all timings recorded so far as a dict (JSON-serialisable)."""
+    return {name: timing.to_dict() for name, timing in timings.items()}
+
+
+def reset():
+    """Zero all timings (probes stay installed)."""
+    for timing in timings.values():
+        timing.__init__()
+
+
+def dump(filename: str):
+    """Write `snapshot()` to `filename` as JSON."""
+    import json  # only needed at exit, so keep it off the startup path
+    with open(filename, 'w') as f:
+        json.dump(snapshot(), f, indent=2)
+
+
+if ENABLED and os.environ['CURDLE_PROBE'] != '1':
+    atexit.register(dump, os.environ['CURDLE_PROBE'])
@@ -0,0 +1,137 @@
+"""
+Record a session's raw input (keys read by the curses View, lines read by the
+vanilla View) as a compact binary log, for replaying later (see replay.py).
+Set CURDLE_RECORD to a file path to record a session of either app.
+
+File format: a header of b'CRDL', format version, app kind (0 vanilla,
+1 curses), word length, random seed (8 bytes, little-endian), then the given
+answer (1 byte length + ASCII). Then one record per input event: milliseconds since the
+previous event, and the input's UTF-8 length + 1 (0 means None, ie a key read
+failed), both as varints, followed by the input itself. A keystroke is
+usually 3 bytes. Writes are buffered, so recording costs little, but flushed
+after the header and at each input boundary (every line, Enter key or failed
+key read, or every FLUSH_EVERY keys), so a hung or killed session still leaves
+a recording up to its last input.
+"""
+
+import os
+from time import perf_counter
+
+MAGIC = b'CRDL'
+VERSION = 3  # 3: seeds draw answers as Wordle.pick() does
+KINDS = ('vanilla', 'curses')
+FLUSH_EVERY = 32  # keys, if no Enter comes first
+
+
+def varint(n: int):
+    """Encode a non-negative int in 7-bit groups, low first (as protobuf)."""
+    out = bytearray()
+    while n > 0x7F:
+        out.append(n & 0x7F | 0x80)
+        n >>= 7
+    out.append(n)
+    return out
+
+
+def read_varint(data: bytes, i: int):
+    """Decode a varint from data[i:], return (value, index after it)."""
+    n = shift = 0
+    while True:
+        byte = data[i]
+        i += 1
+        n |= (byte & 0x7F) << shift
+        if byte < 0x80:
+            return n, i
+        shift += 7
+
+
+class Recorder:
+
+    def __init__(self, filename: str, kind: str, seed: int, answer: str = '',
+                 length: int = 5):
+        self.seed = seed
+        self.lines = kind == 'vanilla'  # each event a whole line
+        self.unflushed = 0  # events written since last flush
+        self.file = open(filename, 'wb')
+        self.file.write(MAGIC + bytes((VERSION, KINDS.index(kind), len(answer) or length))
+                        + seed.to_bytes(8, 'little')
+                        + bytes((len(answer),)) + answer.encode('ascii'))
+        self.file.flush()
+        self.last = perf_counter()
+
+    def record(self, data):
+        """Append an input event (str, or None for a failed key read)."""
+        now = perf_counter()
+        ms = round((now - self.last) * 1000)
+        self.last = now
+
+        if data is None:
+            self.file.write(varint(ms) + b'\x00')
+        else:
+            encoded = data.encode()
+            self.file.write(varint(ms) + varint(len(encoded) + 1) + encoded)
+
+        self.unflushed += 1
+        if self.lines or data in (None, '\n', '\r') or self.unflushed >= FLUSH_EVERY:
+            self.file.flush()
+            self.unflushed = 0
+
+    def close(self):
+        self.file.close()
+
+
+def start_recording(kind: str, answer: str = '', length: int = 5):
+    """
+    If CURDLE_RECORD is set, return a Recorder writing to that path with a
+    fresh random seed (pass it to Wordle so answers can be replayed), else
+    None. The file is closed on exit.
+    """
+    filename = os.environ.get('CURDLE_RECORD')
+    if not filename:
+        return None
+
+    import atexit
+    seed = int.from_bytes(os.urandom(8), 'little')
+    recorder = Recorder(filename, kind, seed, answer, length)
+    atexit.register(recorder.close)
+    return recorder
+
+
+def load(filename: str):
+    """
+    Read a recording. Return a dict of its header values and `events`, a list
+    of (milliseconds since previous event, input) pairs.
+    """
+
+    with open(filename, 'rb') as f:
+        data = f.read()
+
+    if data[:4] != MAGIC or data[4] != VERSION:
+        raise ValueError(f'{filename} is not a curdle recording (version {VERSION})')
+
+    answer_end = 16 + data[15]
+    recording = {
+        'kind': KINDS[data[5]],
+        'length': data[6],
+        'seed': int.from_bytes(data[7:15], 'little'),
+        'answer': data[16:answer_end].decode('ascii'),
+        'events': []
+    }
+
+    # a session killed mid-write can leave a partial last event: drop it
+    i = answer_end
+    while i < len(data):
+        try:
+            ms, i = read_varint(data, i)
+            length, i = read_varint(data, i)
+        except IndexError:
+            break
+        if length > len(data) - i + 1:
+            break
+        if length:
+            recording['events'].append((ms, data[i:i + length - 1].decode()))
+            i += length - 1
+        else:
+            recording['events'].append((ms, None))
+
+    return recording
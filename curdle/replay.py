@@ -0,0 +1,92 @@
+"""
+Replay a recorded session (see recorder.py) through the app's Controller,
+model and view, headless and as fast as possible: eg to reproduce a bug
+exactly, or to load test the stack with real input. Run from the project
+root:
+
+    python -m curdle.replay session.rec [--repeat N]
+
+The recorded seed and answer are passed to Wordle, so answers come up as they
+did in the original session. Recorded timings are ignored (but kept in the
+recording for anyone who wants to look at traffic shape).
+"""
+
+from contextlib import redirect_stdout
+from time import perf_counter
+from .headless import Curses
+from .model import Wordle
+from .recorder import load
+import argparse
+import json
+import os
+
+
+def replay(recording: dict):
+    """
+    Play a recording (as returned by `recorder.load()`) to the end of its
+    input. Return (how it ended, the model): 'exit' if the user exited,
+    'eof' if the input ran out first. Anything else the app raises is raised
+    here too, as it would have been in the original session.
+    """
+
+    inputs = [data for _, data in recording['events']]
+    wordle = Wordle(recording['answer'], seed=recording['seed'], length=recording['length'])
+
+    # imported here: only one kind of view is needed per replay
+    if recording['kind'] == 'vanilla':
+        from vanilla.controller import Controller
+        from vanilla.view import View
+
+        lines = iter(inputs)
+
+        def read(prompt: str):
+            try:
+                return next(lines)
+            except StopIteration:
+                raise EOFError from None  # as input() at end of stdin
+
+        controller = Controller(wordle, View(wordle, read=read))
+    else:
+        from .controller import Controller
+        from .view import View
+
+        curses = Curses(keys=inputs)
+        view = View(curses, curses.stdscr, timed_alerts=False)  # full speed
+        controller = Controller(view, wordle)
+
+    with open(os.devnull, 'w') as devnull, redirect_stdout(devnull):
+        try:
+            controller.run()
+        except SystemExit:
+            return 'exit', wordle
+        except EOFError:
+            return 'eof', wordle
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Replay a recorded session.')
+    parser.add_argument('filename')
+    parser.add_argument('--repeat', type=int, default=1,
+                        help='replay this many times (for load testing)')
+    args = parser.parse_args()
+
+    recording = load(args.filename)
+    start = perf_counter()
+    for _ in range(args.repeat):
+        ending, wordle = replay(recording)
+    seconds = perf_counter() - start
+
+    events = len(recording['events']) * args.repeat
+    print(json.dumps({
+        'kind': recording['kind'],
+        'events': events,
+        'repeat': args.repeat,
+        'ended': ending,
+        'scores': wordle.scores,
+        'seconds': round(seconds, 6),
+        'events_per_second': round(events / seconds) if seconds else None
+    }))
+
+
+if __name__ == '__main__':
+    main()
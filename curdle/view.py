@@ -1,7 +1,8 @@
-from curses import panel
 from string import ascii_letters
 from threading import Timer
 from .config import MenuOption
+from .model import QWERTY
+from .probe import probe
 
 
 class Color:
@@ -44,21 +45,52 @@ class Color:
         )
 
 
+def layout_tracker():
+    """
+    Work out the qwerty tracker layout once: return (y, x, label, tracker
+    index) for each letter. Rows are 2 apart, each offset a little more.
+    """
+    cells = []
+    x = 0
+    for i, row in enumerate(QWERTY):
+        y = i * 2
+        if i == 1:
+            x += 2
+        if i == 2:
+            x += 4
+        for j, (letter, index) in enumerate(row):
+            cells.append((y, x + j * 4, f' {letter.upper()} ', index))
+    return tuple(cells)
+
+
 class View:
 
-    def __init__(self, curses, stdscr):
+    tracker_cells = layout_tracker()
+
+    def __init__(self, curses, stdscr, recorder=None, timed_alerts=True):
+        """
+        Take the curses module (or a stand-in like `headless.Curses`, with
+        `panel` available as an attribute) and the main screen. Keys read are
+        recorded with `recorder` if given. Pass `timed_alerts=False` to show
+        alerts without timers clearing them (eg headless, where nobody reads
+        them and waiting for timers would only slow things down).
+        """
 
         self.curses = curses
+        self.recorder = recorder
+        self.timed_alerts = timed_alerts
+        self.panel = curses.panel
         self.stdscr = stdscr
         self.timer = None
         self.height, self.width = stdscr.getmaxyx()
         self.guess = ''  # buffer holding guess-in-progress
+        self.length = 5  # word length, see reset()
 
         # windows and panels (improve magic numbers? shorten lines?)
         # `self.width + 1` needed to fill width?!
         middle_x = self.width // 2
         self.titlewin, self.titlepanel = self.create_panels(1, self.width + 1, 0, 0)
-        self.guesseswin, self.guessespanel = self.create_panels(12, 19, 5, middle_x - 9)
+        self.guesseswin, self.guessespanel = self.create_guesses_panel()
         self.alertwin, self.alertpanel = self.create_panels(1, 21, 17, middle_x - 10)
         self.trackerwin, self.trackerpanel = self.create_panels(5, 39, 19, middle_x - 19)
         self.menuwin, self.menupanel = self.create_panels(7, 17, 6, middle_x - 8)
@@ -74,9 +106,15 @@ class View:
 
     def create_panels(self, h, w, y, x):
         new_window = self.curses.newwin(h, w, y, x)
-        new_panel = panel.new_panel(new_window)
+        new_panel = self.panel.new_panel(new_window)
         return new_window, new_panel
 
+    def create_guesses_panel(self):
+        """Guesses grid window: 4 columns per letter, less trailing space."""
+        width = self.length * 4 - 1
+        return self.create_panels(12, width, 5, self.width // 2 - width // 2)
+
+    @probe
     def draw_title(self):
         # FIXME: title and menu prompt should be moved from view.py and passed in
         title = 'curdle'
@@ -89,6 +127,7 @@ class View:
         win.addstr(prompt[-3:], Color.WH_RED)
         win.refresh()
 
+    @probe
     def draw_guesses(self):
 
         # stdscr doesn't need this but windows taking input do, otherwise
@@ -97,24 +136,28 @@ class View:
 
         for i in range(6):
             y = i * 2
-            for j in range(5):
+            for j in range(self.length):
                 self.guesseswin.addstr(y, j * 4, '   ', Color.BL_WHITE)
         self.guesseswin.refresh()
 
+    @probe
     def draw_tracker(self, tracker=None):
+        """
+        Draw the letter tracker: all light grey if no tracker passed in (ie on
+        reset), otherwise just the letters changed since it was last drawn.
+        """
 
-        letters = ['qwertyuiop', 'asdfghjkl', 'zxcvbnm']
-        x = 0
+        if tracker is None:
+            changed = -1  # all bits set
+        else:
+            changed = tracker.pop_changed()
+            if not changed:
+                return
 
-        for i, row in enumerate(letters):
-            y = i * 2
-            if i == 1:
-                x += 2
-            if i == 2:
-                x += 4
-            for j, letter in enumerate(row):
-                color = Color.BL_LGREY if not tracker else Color.letter_colors[tracker[letter]]
-                self.trackerwin.addstr(y, x + j * 4, f' {letter.upper()} ', color)
+        for y, x, label, i in self.tracker_cells:
+            if changed >> i & 1:
+                color = Color.letter_colors[tracker.scores[i]] if tracker else Color.BL_LGREY
+                self.trackerwin.addstr(y, x, label, color)
 
         self.trackerwin.refresh()
 
@@ -123,6 +166,7 @@ class View:
         self.menuwin.border()
         self.hide_menu()  # hidden by default
 
+    @probe
     def alert(self, message='', duration=2.5, end_game=False):
         """
         Show a message, either for `duration` or indefinitely if `duration` is
@@ -138,7 +182,7 @@ class View:
             self.alertwin.addstr(0, 21 // 2 - len(message) // 2, message)
         self.alertwin.refresh()
 
-        if not duration or not message:
+        if not duration or not message or not self.timed_alerts:
             return
 
         if self.timer:
@@ -149,15 +193,28 @@ class View:
         if end_game:
             self.timer.join()
 
-    def reset(self):
+    def reset(self, length=5, tracker=None):
+        # Pass in the (just reset) tracker to draw it and clear its changes,
+        # else the first guess redraws every letter again.
+
+        # Resize guesses grid if word length changed: take the old panel out
+        # of the stack (it's freed once replaced), keep menu on top.
+        if length != self.length:
+            self.length = length
+            self.guessespanel.hide()
+            self.guesseswin, self.guessespanel = self.create_guesses_panel()
+            self.menupanel.top()
+            self.panel.update_panels()
+
         self.draw_title()
         self.draw_guesses()
         self.alert()  # without args will clear alert window
-        self.draw_tracker()
+        self.draw_tracker(tracker)
         self.setup_menu()
         self.guess = ''
         self.menu_selected = MenuOption(1)
 
+    @probe
     def draw_scored_guess(self, scored_guess, turn):
         for i, (letter, score) in enumerate(scored_guess):
             letter = f' {letter.upper()} '
@@ -171,9 +228,13 @@ class View:
     def get_key(self, window):
         # Get input key. try/except or terminal window resize will crash getkey().
         try:
-            return window.getkey()
+            key = window.getkey()
         except self.curses.error:
-            pass
+            key = None
+
+        if self.recorder:
+            self.recorder.record(key)
+        return key
 
     def menu(self, end_game=False):
         # discard any input buffered during end game message
@@ -204,6 +265,7 @@ class View:
 
             self.show_menu()
 
+    @probe
     def show_menu(self):
         def center_print(win, text, y, attrs):
             _, width = win.getmaxyx()
@@ -224,14 +286,15 @@ class View:
 
         if self.menupanel.hidden():
             self.menupanel.show()
-            panel.update_panels()
+            self.panel.update_panels()
             self.stdscr.refresh()
 
+    @probe
     def hide_menu(self):
         # .hide() throws error if panel is already hidden
         if not self.menupanel.hidden():
             self.menupanel.hide()
-            panel.update_panels()
+            self.panel.update_panels()
             self.stdscr.refresh()
 
     def do_turn(self, turn):
@@ -244,7 +307,7 @@ class View:
             key = self.get_key(self.guesseswin)
 
             # if valid letter, display it in white box
-            if key in ascii_letters and length < 5:
+            if key in ascii_letters and length < self.length:
                 self.guess += key.lower()
                 letter = f' {key.upper()} '
                 self.guesseswin.addstr((turn - 1) * 2, length * 4, letter, Color.BL_WHITE)
@@ -257,7 +320,7 @@ class View:
 
             # if ENTER (should work cross-platform)
             elif key in ('\n', '\r'):
-                if length == 5:
+                if length == self.length:
                     return self.guess
                 self.alert('Not enough letters')  # FIXME: hardcoded message
 
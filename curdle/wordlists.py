@@ -0,0 +1,38 @@
+"""
+Split a word list into one file per word length, in the form the model
+expects (see model.data_file()): lowercase, a-z only, sorted, no duplicates.
+Eg to make guess and answer lists for 4- and 6- to 8-letter games:
+
+    python -m curdle.wordlists valid_guesses all_words.txt
+    python -m curdle.wordlists valid_answers common_words.txt
+
+The standard 5-letter lists are never overwritten. Every answer should also
+be in the guesses list for its length.
+"""
+
+import sys
+from .config import WORD_LENGTHS
+from .model import data_file
+
+
+def partition(words):
+    """Return a dict of word length: sorted list of valid words that length."""
+    by_length = {length: set() for length in WORD_LENGTHS}
+    for word in words:
+        word = word.strip().lower()
+        if len(word) in by_length and word.isascii() and word.isalpha():
+            by_length[len(word)].add(word)
+    return {length: sorted(words) for length, words in by_length.items()}
+
+
+if __name__ == '__main__':
+    name, filename = sys.argv[1:3]
+    with open(filename) as f:
+        by_length = partition(f)
+
+    for length, words in by_length.items():
+        if length == 5 or not words:
+            continue
+        with open(data_file(name, length), 'w') as f:
+            f.write('\n'.join(words) + '\n')
+        print(f'Wrote {data_file(name, length)}: {len(words)} words')
@@ -0,0 +1,20 @@
+from curdle.batch import run
+import os
+import sys
+
+
+def main():
+    # Read answer/guess lines from stdin, write JSONL to stdout. Use a large
+    # write buffer (even when stdout is a terminal) since output can be big.
+    try:
+        with open(sys.stdout.fileno(), 'w', buffering=1 << 16, closefd=False) as out:
+            run(sys.stdin, out)
+    except BrokenPipeError:
+        # reader went away (eg `| head`): stop quietly. Point stdout at
+        # devnull so Python's flush at exit doesn't raise again.
+        os.dup2(os.open(os.devnull, os.O_WRONLY), sys.stdout.fileno())
+        sys.exit(1)
+
+
+if __name__ == '__main__':
+    main()
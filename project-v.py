@@ -1,15 +1,40 @@
+from time import perf_counter
+START = perf_counter()  # as early as possible, for --startup-time
+
+from curdle.cli import parse_args
 from curdle.model import Wordle
+from curdle.recorder import start_recording
 from vanilla.controller import Controller
 from vanilla.view import View
 import sys
 
 
 def main():
-    # Pass in answer if required during dev
-    answer = sys.argv[1] if len(sys.argv) > 1 else ''
-    wordle = Wordle(answer)  # game object/model
-    view = View(wordle)  # pass in wordle (model) to make observer link
+    # Pass in answer if required during dev, --length for other than 5-letter
+    # words. Or pass --startup-time to draw the first frame, report how long
+    # it took to get there, and exit.
+    options = parse_args(sys.argv[1:])
+    answer, length = options['answer'], options['length']
+
+    try:
+        wordle = Wordle(answer, length=length)  # game object/model
+    except (ValueError, FileNotFoundError) as e:
+        sys.exit(e)
+
+    # record input if CURDLE_RECORD set (see recorder.py), once the answer
+    # is known to be good
+    recorder = start_recording('vanilla', answer, length)
+    if recorder:
+        wordle.seed = recorder.seed  # so answers can be replayed
+    view = View(wordle, recorder)  # pass in wordle (model) to make observer link
     controller = Controller(wordle, view)
+
+    if options['startup_time']:
+        wordle.new_game()  # first frame drawn by view when model notifies
+        print(f'Time to first frame: {(perf_counter() - START) * 1000:.1f}ms',
+              file=sys.stderr)
+        return
+
     controller.run()
 
 
@@ -1,16 +1,45 @@
+from time import perf_counter
+START = perf_counter()  # as early as possible, for --startup-time
+
+from curdle.cli import parse_args
 from curdle.controller import Controller
 from curdle.model import Wordle
+from curdle.recorder import start_recording
 from curdle.view import View
-import curses
+import curses.panel  # View gets panel from curses
 import sys
 
 
-def main(stdscr):
-    # Pass in answer if required during dev
-    answer = sys.argv[1] if len(sys.argv) > 1 else ''
-    wordle = Wordle(answer)  # game object/model
-    view = View(curses, stdscr)
-    Controller(view, wordle).run()
+def main(stdscr, wordle, recorder, startup_time=False):
+    view = View(curses, stdscr, recorder)
+    controller = Controller(view, wordle)
+
+    if startup_time:
+        controller.reset()  # draws the first frame
+        return perf_counter() - START
+
+    controller.run()
+
+
+# Pass in answer if required during dev, --length for other than 5-letter
+# words. Or pass --startup-time to draw the first frame, report how long it
+# took to get there, and exit.
+options = parse_args(sys.argv[1:])
+answer, length = options['answer'], options['length']
+
+# Model set up before curses starts, so any error (eg no word list for
+# --length) shows plainly, and before recording, so a bad answer isn't recorded.
+try:
+    wordle = Wordle(answer, length=length)  # game object/model
+except (ValueError, FileNotFoundError) as e:
+    sys.exit(e)
 
+# record input if CURDLE_RECORD set (see recorder.py)
+recorder = start_recording('curses', answer, length)
+if recorder:
+    wordle.seed = recorder.seed  # so answers can be replayed
 
-curses.wrapper(main)
+elapsed = curses.wrapper(main, wordle, recorder, options['startup_time'])
+if elapsed is not None:
+    # reported after curses exits, or it would be lost on the cleared screen
+    print(f'Time to first frame: {elapsed * 1000:.1f}ms', file=sys.stderr)
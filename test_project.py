@@ -0,0 +1,236 @@
+from bench import compare
+from curdle import difficulty, probe
+from curdle.cli import parse_args
+from curdle.config import Error, Tier
+from curdle.headless import Curses
+from curdle.leaderboard import Leaderboard, Player, Totals
+from curdle.batch import score_lines
+from curdle.model import Tracker, WordSet, Wordle, data_file, score_guess
+from curdle.recorder import Recorder, load
+from curdle.replay import replay
+from curdle.view import View
+from curdle.wordlists import partition
+from pathlib import Path
+import pytest
+import shutil
+import time
+
+
+DATA = Path(__file__).parent / 'data'
+
+
+@pytest.fixture
+def workdir(tmp_path, monkeypatch):
+    """
+    Run the test in tmp_path with a copy of the data dir (safe to add to or
+    edit), so files the app writes to the cwd (eg debug.log) stay out of
+    the repo.
+    """
+    shutil.copytree(DATA, tmp_path / 'data')
+    monkeypatch.chdir(tmp_path)
+    return tmp_path
+
+
+def test_score_guess():
+    assert [int(s) for _, s in score_guess('slate', 'crane')] == [1, 1, 3, 1, 3]
+    # repeated letter: only one of the two Es is in the answer
+    assert [int(s) for _, s in score_guess('geese', 'crane')] == [1, 1, 1, 1, 3]
+
+
+def test_score_lines():
+    lines = ['crane slate crane\n', '\n', 'crane,zzzzz\n', 'abc\n']
+    first, second, third = score_lines(lines)
+    assert first['status'] == 'solved' and first['result'] == 2
+    assert second['status'] == 'playing'
+    assert second['turns'] == [{'guess': 'zzzzz', 'error': 'Not in word list'}]
+    assert third == {'line': 4, 'answer': 'abc', 'error': 'Not enough letters'}
+
+
+def test_probe_wrap(monkeypatch):
+    monkeypatch.setattr(probe, 'timings', {})  # restored after, without test.stage
+
+    def stage():
+        return 'ok'
+
+    timed = probe.wrap(stage, 'test.stage')
+    assert timed() == 'ok' and timed() == 'ok'
+    stats = probe.snapshot()['test.stage']
+    assert stats['calls'] == 2
+    assert sum(stats['histogram_us'].values()) == 2
+
+
+def test_headless_view():
+    curses = Curses()
+    view = View(curses, curses.stdscr)
+    tracker = Tracker()
+    tracker.reset()  # as new_game()
+    view.reset(tracker=tracker)
+    assert tracker.pop_changed() == 0  # all drawn, so first guess draws only its letters
+    view.draw_scored_guess(score_guess('slate', 'crane'), 1)
+    assert view.guesseswin.text().splitlines()[0] == ' S   L   A   T   E '
+    assert ' Q   W   E ' in view.trackerwin.text()
+
+
+def test_tracker():
+    tracker = Tracker()
+    tracker.update(score_guess('slate', 'crane'))
+    tracker.update(score_guess('sassy', 'crane'))  # a stays CORRECT
+    assert tracker['a'] == 3 and tracker['s'] == 1 and tracker['z'] == 0
+    changed = tracker.pop_changed()
+    assert {letter for letter, _ in tracker.items() if changed >> (ord(letter) - 97) & 1} \
+        == set('slatey')
+    assert tracker.pop_changed() == 0
+
+
+def test_wordset(tmp_path, monkeypatch):
+    read = WordSet.read
+
+    def slow_read(self, filename):
+        time.sleep(0.05)
+        read(self, filename)
+
+    monkeypatch.setattr(WordSet, 'read', slow_read)
+    monkeypatch.setattr(WordSet, 'loaded', {})
+
+    wordle = Wordle()
+    assert wordle.valid_guesses.words is None  # still loading in background
+    assert wordle.check_error('crane') is None  # waits for it
+    assert len(wordle.valid_guesses) > 10_000
+
+    missing = WordSet(str(tmp_path / 'missing.txt'))
+    with pytest.raises(FileNotFoundError):
+        'crane' in missing
+
+
+def test_difficulty_tiers():
+    tiers = difficulty.load()
+    assert sum(len(answers) for answers in tiers.values()) == 2315
+    wordle = Wordle(tier=Tier.HARD)
+    assert wordle.next_answer() in tiers[Tier.HARD]
+
+
+def test_difficulty_out_of_date(workdir):
+    answers_file = workdir / 'data' / 'valid_answers.txt'
+    answers = answers_file.read_text().splitlines()
+    answers[:2] = answers[1::-1]  # same count, 2 swapped
+    answers_file.write_text('\n'.join(answers))
+
+    difficulty.load.cache_clear()
+    with pytest.raises(ValueError, match='out of date'):
+        difficulty.load()
+    difficulty.load.cache_clear()
+
+
+def test_record_and_replay(workdir):
+    filename = workdir / 'session.rec'
+    recorder = Recorder(filename, 'vanilla', seed=42, answer='crane')
+    for line in ('slate', 'crane', 'n', 'abcde', None):
+        recorder.record(line)
+    assert len(load(filename)['events']) == 5  # flushed as it goes, eg if killed
+    recorder.close()
+
+    recording = load(filename)
+    assert recording['answer'] == 'crane' and recording['seed'] == 42
+    assert [data for _, data in recording['events']][-1] is None
+
+    recording['events'].pop()  # (None is only recorded by the curses view)
+    ending, wordle = replay(recording)
+    assert ending == 'eof'
+    assert wordle.scores == [2]
+    assert len(wordle.previous_guesses) == 0  # new game, 'abcde' invalid
+
+
+def test_other_word_length(workdir):
+    by_length = partition(['planet', 'Planes', 'plan', 'cranes', "can't", 'crane'])
+    assert by_length[6] == ['cranes', 'planes', 'planet'] and by_length[4] == ['plan']
+    with open(data_file('valid_guesses', 6), 'w') as f:
+        f.write('\n'.join(by_length[6]))
+    with pytest.raises(FileNotFoundError, match='valid_answers_6'):
+        Wordle(length=6)  # fails at setup, not at new game
+    with pytest.raises(FileNotFoundError, match='difficulty_6'):
+        Wordle('planet', tier=Tier.HARD)
+    with open(data_file('valid_answers', 6), 'w') as f:
+        f.write('\n'.join(by_length[6]))
+
+    wordle = Wordle(length=6, seed=1)
+    wordle.new_game()
+    assert len(wordle.answer) == 6
+    assert wordle.check_error('crane') == Error.TOOSHORT
+    wordle.submit(wordle.answer)
+    assert wordle.scores == [1]
+
+    curses = Curses()
+    view = View(curses, curses.stdscr)
+    view.reset(6)
+    grids = [win for win in curses.visible_panels() if win.height == 12]
+    assert grids == [view.guesseswin]  # old 5-letter grid gone
+    view.draw_scored_guess(score_guess('planet', 'planes'), 1)
+    assert view.guesseswin.text().splitlines()[0] == ' P   L   A   N   E   T '
+
+
+def test_leaderboard(workdir):
+    # 2 boards ≈ 2 workers; ann plays a session on each
+    boards = [Leaderboard(top=2, maxsize=5), Leaderboard(top=2)]
+    ann, bob, cat = Player('ann'), Player('bob'), Player('cat')
+    for player, scores, board in ((ann, [3, 4], boards[0]),
+                                  (bob, [6, 5, 4], boards[1]),
+                                  (ann, [0, 2], boards[1]),
+                                  (cat, [0, 1], boards[1])):
+        wordle = Wordle('crane')
+        wordle.player, wordle.leaderboard = player, board
+        for score in scores:
+            wordle.new_game()
+            guesses = ['slate'] * (score - 1 if score else 6) + (['crane'] if score else [])
+            for guess in guesses:
+                wordle.submit(guess)
+        assert wordle.scores == scores
+
+    guest = Wordle('crane')
+    guest.leaderboard = boards[0]  # no player: game not recorded
+    guest.new_game()
+    guest.submit('crane')
+
+    assert boards[0].drain() == 2
+
+    # each worker ships what it's gathered since last time, merged once
+    merged = Leaderboard(top=2)
+    for _ in range(2):
+        for board in boards:
+            merged.merge(Totals.from_dict(board.take().to_dict()))
+    stats = merged.stats
+    assert stats['played'] == 9 and stats['wins'] == 78
+    assert stats['distribution'] == {1: 1, 2: 1, 3: 1, 4: 2, 5: 1, 6: 1}
+    assert stats['leaders'] == [('bob', 3), ('ann', 2)]
+    assert boards[1].stats['played'] == 0
+    assert ann.wins == 3 and ann.mean == 3 and ann.streak == 1
+    assert merged.rank(ann.mean) == 72  # (2 lost + 4 worse + ½ same) / 9
+    assert merged.rank(1.0) > merged.rank(3.0) > merged.rank(5.0)
+
+
+def test_replay_curses(workdir):
+    keys = [*'zzzzz\n', *['KEY_BACKSPACE'] * 5, *'slate\n', *'crane\n',
+            'KEY_DOWN', 'KEY_DOWN', '\n']  # menu: exit
+    recording = {'kind': 'curses', 'length': 5, 'seed': 1, 'answer': 'crane',
+                 'events': [(0, key) for key in keys]}
+    ending, wordle = replay(recording)
+    assert ending == 'exit'
+    assert wordle.scores == [2]
+
+
+def test_length_option():
+    assert parse_args(['Planet', '--length', '6']) == \
+        {'answer': 'planet', 'length': 6, 'startup_time': False}
+    assert parse_args(['--length=7', '--startup-time'])['length'] == 7
+    with pytest.raises(FileNotFoundError, match='No word list for 7-letter words'):
+        Wordle(length=7)  # at setup, not mid-game
+    for answer in ('crané', 'a' * 300):  # rejected before anything's recorded
+        with pytest.raises(ValueError):
+            Wordle(answer)
+
+
+def test_bench_compare():
+    baseline = {'old': {'us_per_op': 10.0}, 'slower': {'us_per_op': 10.0}}
+    results = {'old': {'us_per_op': 12.0},  # within threshold
+               'slower': {'us_per_op': 13.0},
+               'new': {'us_per_op': 99.0}}  # nothing to compare with
+    assert compare(results, baseline, threshold=1.25) == [('slower', 10.0, 13.0)]
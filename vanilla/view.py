@@ -1,17 +1,41 @@
 import os
 import re
 from curdle.config import AnsiCode as Code, SCORE_COLORS, Error, MenuOption
-
-# Windows hack: needed to ensure ANSI codes are interpreted rather than
-# printed in Power Shell/Command Prompt
-os.system('')
+from curdle.model import QWERTY
+from curdle.probe import probe
 
 APP_WIDTH = 42
 
 
+def enable_ansi():
+    """
+    Windows: ensure ANSI codes are interpreted rather than printed in Power
+    Shell/Command Prompt, by turning on virtual terminal processing for the
+    console directly (rather than the old `os.system('')` hack, which spawns
+    a shell just for its side effect). Nothing to do elsewhere.
+    """
+    if os.name != 'nt':
+        return
+
+    import ctypes
+    kernel32 = ctypes.windll.kernel32
+    handle = kernel32.GetStdHandle(-11)  # STD_OUTPUT_HANDLE
+    mode = ctypes.c_ulong()
+    if kernel32.GetConsoleMode(handle, ctypes.byref(mode)):
+        # ENABLE_VIRTUAL_TERMINAL_PROCESSING
+        kernel32.SetConsoleMode(handle, mode.value | 0x0004)
+
+
 class View:
-    def __init__(self, model):
-        """Initiate the view object."""
+    def __init__(self, model, recorder=None, read=input):
+        """
+        Initiate the view object. Input lines are read with `read` (ie input()
+        unless eg replaying), and recorded with `recorder` if given.
+        """
+
+        enable_ansi()
+        self.recorder = recorder
+        self.read = read
 
         # Observer pattern: model will call self.update() when game state changed
         model.attach(self)
@@ -27,7 +51,7 @@ class View:
 
     def colorize(self, scored_list: list):
         """
-        Expect a list of tuple pairs [(letter, score)…], return a
+        Expect an iterable of tuple pairs [(letter, score)…], return a
         corresponding string colored using ANSI codes.
         """
         output = ''
@@ -45,13 +69,21 @@ class View:
             's': MenuOption.STATS,
             'e': MenuOption.EXIT
         }
-        key = input('[N]ew game, [S]tats, [E]xit: ').lower()
+        key = self.read_line('[N]ew game, [S]tats, [E]xit: ').lower()
         return options.get(key, None)
 
     def get_input(self, turn: int):
         """Return input during game round (ie a guess)."""
-        return input(f'Round {turn}: ').lower()
+        return self.read_line(f'Round {turn}: ').lower()
 
+    def read_line(self, prompt: str):
+        """Read a line of user input, record it if recording."""
+        line = self.read(prompt)
+        if self.recorder:
+            self.recorder.record(line)
+        return line
+
+    @probe
     def update(self, game_state):
         """Print game state to screen. Called from model (Observer pattern)."""
 
@@ -61,13 +93,14 @@ class View:
         else:  # else print whole game board
             self.draw_guesses(game_state)
             self.draw_alert(game_state.alert)
-            self.draw_qwerty(game_state.qwerty)
+            self.draw_qwerty(game_state.tracker)
 
+    @probe
     def draw_guesses(self, game_state):
         """
         Print guesses board. Previous guesses, then blank rows to a total of 6.
         """
-        blank_row = [(' ', -1)] * 5  # -1 == LIGHT_GREY
+        blank_row = [(' ', -1)] * game_state.length  # -1 == LIGHT_GREY
         blank_rows_needed = game_state.MAX_TURNS - len(game_state.previous_guesses)
         blank_rows = [blank_row] * blank_rows_needed
         rows = game_state.previous_guesses + blank_rows
@@ -77,18 +110,22 @@ class View:
             print(self.center(self.colorize(row)))
             print()
 
+    @probe
     def draw_alert(self, alert):
         """Print an alert box with game message or blank line if none."""
         alert = self.center(f'{Code.RED} {alert} {Code.RESET}') if alert else ''
         print(alert)
 
-    def draw_qwerty(self, qwerty: list):
+    @probe
+    def draw_qwerty(self, tracker):
         """Print the qwerty layout letter tracker."""
+        scores = tracker.scores
         print()
-        for i, row in enumerate(qwerty):
-            print(self.center(self.colorize(row)))
+        for row in QWERTY:
+            print(self.center(self.colorize((letter, scores[i]) for letter, i in row)))
             print()
 
+    @probe
     def draw_stats(self, stats: dict):
         """
         Print stats based on previous game scores. The labels of the 4 stats